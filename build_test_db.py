@@ -6,21 +6,58 @@ for testing FUSE filesystem ctime and mtime correctness.
 Loads schema from sql/init.sql and populates with test data.
 """
 
+import functools
+import os
 import sqlite3
+import sys
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
 import typer
-import uuid
 
-app = typer.Typer(help="Build test SQLite database with specific timestamps")
+app = typer.Typer(
+    help="Build test SQLite database with specific timestamps",
+    # Output is plain ANSI; skip rich help markup and tracebacks
+    rich_markup_mode=None,
+    pretty_exceptions_enable=False,
+)
 
 # Colors for terminal output
 GREEN = "\033[92m"
 BLUE = "\033[94m"
 RESET = "\033[0m"
 
-
+# Bind datetimes in SQLite format: YYYY-MM-DD HH:MM:SS (not ISO format with T).
+# The adapter is a C-level callable, so executemany converts each value
+# during parameter binding without a Python-level strftime per row.
+sqlite3.register_adapter(
+    datetime, functools.partial(datetime.isoformat, sep=" ", timespec="seconds")
+)
+
+# Column orders match the row tuples built by insert_folder/insert_note.
+# A single definition per statement means sqlite3's per-connection
+# statement cache always sees the same SQL text, so each INSERT is
+# prepared once per connection.
+_INSERT_FOLDER_SQL = (
+    "INSERT INTO folders (id, title, parent_id, user_id, created_at, updated_at) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_INSERT_NOTE_SQL = (
+    "INSERT INTO notes (id, title, syntax, content, parent_id, user_id, created_at, updated_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Number of rows handed to each executemany call
+BATCH_SIZE = 10000
+
+# many_files builds in memory and writes the file once above this many files
+IN_MEMORY_BUILD_THRESHOLD = 10000
+
+
+@functools.lru_cache(maxsize=1)
 def find_sql_init_file() -> Path:
     """Find sql/init.sql relative to this script"""
     script_dir = Path(__file__).parent
@@ -32,56 +69,104 @@ def find_sql_init_file() -> Path:
     return sql_file
 
 
-def init_schema(db_path: Path) -> None:
-    """Initialize database schema from sql/init.sql"""
-    sql_file = find_sql_init_file()
+def connect(db_path: Path) -> sqlite3.Connection:
+    """Open a connection in autocommit mode so transactions are explicit"""
+    conn = sqlite3.connect(db_path, isolation_level=None)
+
+    # The test database is rebuilt from scratch, so trade durability for
+    # bulk load speed: no fsync on commit, temp data and 64MB cache in memory
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -64000")
+
+    return conn
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run the enclosed statements in a single BEGIN/COMMIT transaction"""
+    conn.execute("BEGIN")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_schema_sql() -> str:
+    """Read sql/init.sql once and cache its contents"""
+    with open(find_sql_init_file(), "r") as f:
+        return f.read()
+
+
+@contextmanager
+def suspended_indexes_and_triggers(
+    conn: sqlite3.Connection, table: str
+) -> Iterator[None]:
+    """Drop a table's indexes and triggers for a bulk load and recreate them afterwards
+
+    Run this inside a transaction: if the body raises, rolling back the
+    transaction restores the dropped objects.
+    """
+    objects = conn.execute(
+        """
+        SELECT type, name, sql FROM sqlite_master
+        WHERE tbl_name = ? AND type IN ('index', 'trigger') AND sql IS NOT NULL
+        """,
+        (table,),
+    ).fetchall()
 
-    # Read the SQL schema file
-    with open(sql_file, "r") as f:
-        schema_sql = f.read()
+    for obj_type, name, _ in objects:
+        conn.execute(f'DROP {obj_type.upper()} "{name}"')
 
-    conn = sqlite3.connect(db_path)
+    yield
+
+    for _, _, sql in objects:
+        conn.execute(sql)
+
+
+def init_schema(db_path: Union[Path, str]) -> sqlite3.Connection:
+    """Initialize database schema from sql/init.sql and return the open connection"""
+    schema_sql = _load_schema_sql()
+
+    conn = connect(db_path)
     cursor = conn.cursor()
 
     # Execute the entire schema
     cursor.executescript(schema_sql)
 
-    conn.commit()
-    conn.close()
+    return conn
+
+
+def copy_to_disk(conn: sqlite3.Connection, db_path: Path) -> None:
+    """Write a database built in memory to db_path in one sequential pass"""
+    disk = sqlite3.connect(db_path)
+    conn.backup(disk)
+
+    # In-memory databases cannot use WAL, so enable it on the copy
+    disk.execute("PRAGMA journal_mode = WAL")
+    disk.close()
 
 
 def insert_folder(
-    db_path: Path,
     title: str,
     user_id: str,
     created_at: datetime,
     updated_at: datetime,
     parent_id: Optional[str] = None,
-) -> str:
-    """Insert a folder and return its ID"""
-    folder_id = str(uuid.uuid4())
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+) -> Tuple[str, tuple]:
+    """Build a folder row and return its ID along with the row values"""
+    from uuid import uuid4
 
-    # Use SQLite datetime format: YYYY-MM-DD HH:MM:SS (not ISO format with T)
-    created_str = created_at.strftime("%Y-%m-%d %H:%M:%S")
-    updated_str = updated_at.strftime("%Y-%m-%d %H:%M:%S")
+    folder_id = str(uuid4())
 
-    cursor.execute(
-        """
-        INSERT INTO folders (id, title, parent_id, user_id, created_at, updated_at)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        (folder_id, title, parent_id, user_id, created_str, updated_str),
-    )
-
-    conn.commit()
-    conn.close()
-    return folder_id
+    return folder_id, (folder_id, title, parent_id, user_id, created_at, updated_at)
 
 
 def insert_note(
-    db_path: Path,
     title: str,
     syntax: str,
     content: str,
@@ -89,36 +174,93 @@ def insert_note(
     created_at: datetime,
     updated_at: datetime,
     parent_id: Optional[str] = None,
-) -> str:
-    """Insert a note and return its ID"""
-    note_id = str(uuid.uuid4())
-    conn = sqlite3.connect(db_path)
+    note_id: Optional[str] = None,
+) -> Tuple[str, tuple]:
+    """Build a note row and return its ID along with the row values"""
+    if note_id is None:
+        from uuid import uuid4
+
+        note_id = str(uuid4())
+
+    return note_id, (
+        note_id,
+        title,
+        syntax,
+        content,
+        parent_id,
+        user_id,
+        created_at,
+        updated_at,
+    )
+
+
+def batch_uuids(n: int) -> List[str]:
+    """Generate n random UUID strings from a single os.urandom call"""
+    from uuid import UUID
+
+    raw = os.urandom(16 * n)
+    return [
+        str(UUID(bytes=raw[i : i + 16], version=4))
+        for i in range(0, 16 * n, 16)
+    ]
+
+
+def insert_rows(
+    conn: sqlite3.Connection,
+    sql: str,
+    rows: Iterable[tuple],
+    on_batch: Optional[Callable[[int], None]] = None,
+) -> int:
+    """Insert rows with executemany in batches and return the number inserted"""
+    rows = iter(rows)
+    total = 0
+
+    # One cursor for every batch, so sqlite3 prepares the statement once
     cursor = conn.cursor()
+    while batch := list(islice(rows, BATCH_SIZE)):
+        cursor.executemany(sql, batch)
+        total += len(batch)
+        if on_batch is not None:
+            on_batch(total)
 
-    # Use SQLite datetime format: YYYY-MM-DD HH:MM:SS (not ISO format with T)
-    created_str = created_at.strftime("%Y-%m-%d %H:%M:%S")
-    updated_str = updated_at.strftime("%Y-%m-%d %H:%M:%S")
+    return total
 
-    cursor.execute(
-        """
-        INSERT INTO notes (id, title, syntax, content, parent_id, user_id, created_at, updated_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            note_id,
-            title,
-            syntax,
-            content,
-            parent_id,
-            user_id,
-            created_str,
-            updated_str,
-        ),
-    )
 
-    conn.commit()
-    conn.close()
-    return note_id
+def progress_reporter(
+    total: int, label: str, interval: float = 1.0
+) -> Callable[[int], None]:
+    """Return an on_batch callback that redraws one progress line at most once per interval"""
+    last_write = 0.0
+
+    def report(done: int) -> None:
+        nonlocal last_write
+        now = time.monotonic()
+        if done < total and now - last_write < interval:
+            return
+        last_write = now
+        end = "\n" if done >= total else ""
+        sys.stdout.write(f"\r  Created {done}/{total} {label}...{end}")
+        sys.stdout.flush()
+
+    return report
+
+
+def insert_folder_rows(
+    conn: sqlite3.Connection,
+    rows: Iterable[tuple],
+    on_batch: Optional[Callable[[int], None]] = None,
+) -> int:
+    """Insert rows built by insert_folder"""
+    return insert_rows(conn, _INSERT_FOLDER_SQL, rows, on_batch)
+
+
+def insert_note_rows(
+    conn: sqlite3.Connection,
+    rows: Iterable[tuple],
+    on_batch: Optional[Callable[[int], None]] = None,
+) -> int:
+    """Insert rows built by insert_note"""
+    return insert_rows(conn, _INSERT_NOTE_SQL, rows, on_batch)
 
 
 @app.command()
@@ -140,7 +282,7 @@ def basic(
 
     # Initialize schema
     try:
-        init_schema(db_file)
+        conn = init_schema(db_file)
         print(f"{GREEN}✓{RESET} Database schema loaded from sql/init.sql")
         print(f"  - Tables: folders, notes, notes_history")
         print(f"  - Views: v_folder_id_path_mapping, v_note_id_path_mapping")
@@ -157,121 +299,136 @@ def basic(
     one_week_ago = now - timedelta(days=7)
     one_month_ago = now - timedelta(days=30)
 
+    folder_rows: List[tuple] = []
+    note_rows: List[tuple] = []
+
     # Create test folders
     print(f"\n{BLUE}Creating test folders:{RESET}")
 
-    root_folder_id = insert_folder(
-        db_file,
+    root_folder_id, row = insert_folder(
         "documents",
         user_id,
         one_month_ago,
         one_week_ago,
     )
+    folder_rows.append(row)
     print(f"{GREEN}✓{RESET} documents/ (created: 30d ago, modified: 7d ago)")
 
-    projects_id = insert_folder(
-        db_file,
+    projects_id, row = insert_folder(
         "projects",
         user_id,
         one_week_ago,
         one_day_ago,
     )
+    folder_rows.append(row)
     print(f"{GREEN}✓{RESET} projects/ (created: 7d ago, modified: 1d ago)")
 
-    archive_id = insert_folder(
-        db_file,
+    archive_id, row = insert_folder(
         "archive",
         user_id,
         one_month_ago,
         one_month_ago,  # Never modified
     )
+    folder_rows.append(row)
     print(f"{GREEN}✓{RESET} archive/ (created: 30d ago, modified: 30d ago)")
 
-    work_id = insert_folder(
-        db_file,
+    work_id, row = insert_folder(
         "work",
         user_id,
         one_day_ago,
         one_hour_ago,
         parent_id=projects_id,
     )
+    folder_rows.append(row)
     print(f"{GREEN}✓{RESET} projects/work/ (created: 1d ago, modified: 1h ago)")
 
     # Create test notes with varied timestamps
     print(f"\n{BLUE}Creating test notes:{RESET}")
 
-    insert_note(
-        db_file,
-        "old_document",
-        "md",
-        "This is an old document.\n\nIt was created a month ago and never modified.",
-        user_id,
-        one_month_ago,
-        one_month_ago,
-        parent_id=root_folder_id,
+    note_rows.append(
+        insert_note(
+            "old_document",
+            "md",
+            "This is an old document.\n\nIt was created a month ago and never modified.",
+            user_id,
+            one_month_ago,
+            one_month_ago,
+            parent_id=root_folder_id,
+        )[1]
     )
     print(f"{GREEN}✓{RESET} documents/old_document.md (created: 30d ago, modified: 30d ago)")
 
-    insert_note(
-        db_file,
-        "recently_modified",
-        "md",
-        "This document was modified recently.\n\nIt was created a week ago but modified today.",
-        user_id,
-        one_week_ago,
-        one_hour_ago,
-        parent_id=root_folder_id,
+    note_rows.append(
+        insert_note(
+            "recently_modified",
+            "md",
+            "This document was modified recently.\n\nIt was created a week ago but modified today.",
+            user_id,
+            one_week_ago,
+            one_hour_ago,
+            parent_id=root_folder_id,
+        )[1]
     )
     print(f"{GREEN}✓{RESET} documents/recently_modified.md (created: 7d ago, modified: 1h ago)")
 
-    insert_note(
-        db_file,
-        "new_document",
-        "txt",
-        "This is a new document created today.",
-        user_id,
-        one_hour_ago,
-        one_hour_ago,
-        parent_id=root_folder_id,
+    note_rows.append(
+        insert_note(
+            "new_document",
+            "txt",
+            "This is a new document created today.",
+            user_id,
+            one_hour_ago,
+            one_hour_ago,
+            parent_id=root_folder_id,
+        )[1]
     )
     print(f"{GREEN}✓{RESET} documents/new_document.txt (created: 1h ago, modified: 1h ago)")
 
-    insert_note(
-        db_file,
-        "readme",
-        "md",
-        "# Project README\n\nThis is the main project readme.",
-        user_id,
-        one_week_ago,
-        one_day_ago,
-        parent_id=projects_id,
+    note_rows.append(
+        insert_note(
+            "readme",
+            "md",
+            "# Project README\n\nThis is the main project readme.",
+            user_id,
+            one_week_ago,
+            one_day_ago,
+            parent_id=projects_id,
+        )[1]
     )
     print(f"{GREEN}✓{RESET} projects/readme.md (created: 7d ago, modified: 1d ago)")
 
-    insert_note(
-        db_file,
-        "todo",
-        "md",
-        "# TODO List\n\n- [ ] Task 1\n- [ ] Task 2",
-        user_id,
-        one_day_ago,
-        one_hour_ago,
-        parent_id=work_id,
+    note_rows.append(
+        insert_note(
+            "todo",
+            "md",
+            "# TODO List\n\n- [ ] Task 1\n- [ ] Task 2",
+            user_id,
+            one_day_ago,
+            one_hour_ago,
+            parent_id=work_id,
+        )[1]
     )
     print(f"{GREEN}✓{RESET} projects/work/todo.md (created: 1d ago, modified: 1h ago)")
 
-    insert_note(
-        db_file,
-        "archived",
-        "py",
-        "# Old Python Script\n\nprint('This script is archived')",
-        user_id,
-        one_month_ago,
-        one_month_ago,
-        parent_id=archive_id,
+    note_rows.append(
+        insert_note(
+            "archived",
+            "py",
+            "# Old Python Script\n\nprint('This script is archived')",
+            user_id,
+            one_month_ago,
+            one_month_ago,
+            parent_id=archive_id,
+        )[1]
     )
     print(f"{GREEN}✓{RESET} archive/archived.py (created: 30d ago, modified: 30d ago)")
 
+    # Write all rows in one transaction, one executemany per table
+    with transaction(conn):
+        insert_folder_rows(conn, folder_rows)
+        insert_note_rows(conn, note_rows)
+    conn.close()
+
     print(f"\n{BLUE}{'='*60}{RESET}")
     print(f"{GREEN}✓ Test database created successfully{RESET}")
     print(f"{BLUE}{'='*60}{RESET}\n")
@@ -305,7 +462,7 @@ def edge_cases(
     print(f"\n{BLUE}Creating edge case test database at {db_path}{RESET}\n")
 
     try:
-        init_schema(db_file)
+        conn = init_schema(db_file)
         print(f"{GREEN}✓{RESET} Database schema loaded from sql/init.sql")
     except FileNotFoundError as e:
         print(f"\n{BLUE}Error:{RESET} {e}")
@@ -317,68 +474,78 @@ def edge_cases(
     epoch = datetime(1970, 1, 1)  # Unix epoch
     future = now + timedelta(days=365)  # Future date
 
+    folder_rows: List[tuple] = []
+    note_rows: List[tuple] = []
+
     print(f"\n{BLUE}Creating edge case folders:{RESET}")
 
     # Same created and modified time
-    insert_folder(db_file, "same_time", user_id, midnight, midnight)
+    folder_rows.append(insert_folder("same_time", user_id, midnight, midnight)[1])
     print(f"{GREEN}✓{RESET} same_time/ (created and modified at same time)")
 
     # Just created (created_at = updated_at = now)
-    insert_folder(db_file, "just_created", user_id, now, now)
+    folder_rows.append(insert_folder("just_created", user_id, now, now)[1])
     print(f"{GREEN}✓{RESET} just_created/ (created and modified right now)")
 
     print(f"\n{BLUE}Creating edge case notes:{RESET}")
 
     # Large time gap between creation and modification
-    insert_note(
-        db_file,
-        "old_created_recent_modified",
-        "md",
-        "Created long ago but modified very recently.",
-        user_id,
-        one_month_ago := now - timedelta(days=30),
-        now,
+    note_rows.append(
+        insert_note(
+            "old_created_recent_modified",
+            "md",
+            "Created long ago but modified very recently.",
+            user_id,
+            one_month_ago := now - timedelta(days=30),
+            now,
+        )[1]
     )
     print(f"{GREEN}✓{RESET} old_created_recent_modified.md (30 day time gap)")
 
     # Minimal difference
-    insert_note(
-        db_file,
-        "minimal_diff",
-        "txt",
-        "Barely modified.",
-        user_id,
-        now - timedelta(seconds=1),
-        now,
+    note_rows.append(
+        insert_note(
+            "minimal_diff",
+            "txt",
+            "Barely modified.",
+            user_id,
+            now - timedelta(seconds=1),
+            now,
+        )[1]
     )
     print(f"{GREEN}✓{RESET} minimal_diff.txt (1 second time gap)")
 
     # Same timestamp
-    insert_note(
-        db_file,
-        "identical_times",
-        "md",
-        "This file has identical creation and modification time.",
-        user_id,
-        midnight,
-        midnight,
+    note_rows.append(
+        insert_note(
+            "identical_times",
+            "md",
+            "This file has identical creation and modification time.",
+            user_id,
+            midnight,
+            midnight,
+        )[1]
     )
     print(f"{GREEN}✓{RESET} identical_times.md (identical timestamps)")
 
-    # Very old file (if supported)
-    try:
+    # Very old file
+    note_rows.append(
         insert_note(
-            db_file,
             "very_old",
             "txt",
             "From the ancient times.",
             user_id,
             epoch,
             epoch,
-        )
-        print(f"{GREEN}✓{RESET} very_old.txt (epoch: 1970-01-01)")
-    except Exception as e:
-        print(f"⚠ very_old.txt skipped (epoch not supported): {e}")
+        )[1]
+    )
+    print(f"{GREEN}✓{RESET} very_old.txt (epoch: 1970-01-01)")
+
+    # Write all rows in one transaction, one executemany per table
+    with transaction(conn):
+        insert_folder_rows(conn, folder_rows)
+        insert_note_rows(conn, note_rows)
+    conn.close()
 
     print(f"\n{BLUE}{'='*60}{RESET}")
     print(f"{GREEN}✓ Edge case database created successfully{RESET}")
@@ -396,8 +563,25 @@ def many_files(
     db_path: str = typer.Argument(..., help="Path to SQLite database file to create"),
     count: int = typer.Option(100, help="Number of files to create"),
     user_id: str = typer.Option("test_user", help="User ID to use in database"),
+    content_size: int = typer.Option(
+        64, help="Number of filler characters in each file's content"
+    ),
+    in_memory_build: Optional[bool] = typer.Option(
+        None,
+        "--in-memory-build/--on-disk-build",
+        help="Build in memory and write the file once at the end "
+        f"[default: in memory when --count > {IN_MEMORY_BUILD_THRESHOLD}]",
+        show_default=False,
+    ),
 ):
-    """Create database with many files to test performance"""
+    """Create database with many files to test performance
+
+    Every file gets the same amount of filler content (--content-size), so
+    the total database size grows linearly with --count.
+    """
+    if in_memory_build is None:
+        in_memory_build = count > IN_MEMORY_BUILD_THRESHOLD
+
     db_file = Path(db_path)
 
     if db_file.exists():
@@ -410,49 +594,78 @@ def many_files(
     print(f"\n{BLUE}Creating database with {count} test files at {db_path}{RESET}\n")
 
     try:
-        init_schema(db_file)
+        conn = init_schema(":memory:" if in_memory_build else db_file)
         print(f"{GREEN}✓{RESET} Database schema loaded from sql/init.sql")
     except FileNotFoundError as e:
         print(f"\n{BLUE}Error:{RESET} {e}")
         return
 
-    # Create main folder
-    main_folder_id = insert_folder(
-        db_file,
-        "test_files",
-        user_id,
-        datetime.now() - timedelta(days=1),
-        datetime.now(),
-    )
-    print(f"{GREEN}✓{RESET} test_files/ folder created")
-
-    now = datetime.now()
-    print(f"\n{BLUE}Creating {count} test files:{RESET}")
-
-    # Create many files with incremental timestamps
-    for i in range(count):
-        # Spread timestamps over the last 'count' hours
-        file_time = now - timedelta(hours=count - i)
-
-        insert_note(
-            db_file,
-            f"file_{i:04d}",
-            "txt",
-            f"Test file #{i}\n\nContent: {i * 'x'}",
+    with transaction(conn):
+        # Create main folder
+        main_folder_id, row = insert_folder(
+            "test_files",
             user_id,
-            file_time,
-            file_time,
-            parent_id=main_folder_id,
+            datetime.now() - timedelta(days=1),
+            datetime.now(),
+        )
+        insert_folder_rows(conn, [row])
+        print(f"{GREEN}✓{RESET} test_files/ folder created")
+
+        now = datetime.now()
+        print(f"\n{BLUE}Creating {count} test files:{RESET}")
+
+        # Create many files with incremental timestamps, spread over the
+        # last 'count' hours. Step naive datetimes from one start so a DST
+        # change in the range can't repeat or skip an hour
+        start_time = now - timedelta(hours=count)
+        hour = timedelta(hours=1)
+        filler = "x" * content_size
+
+        def gen_rows() -> Iterator[tuple]:
+            # Rows are produced as executemany consumes them, and IDs are
+            # drawn one batch at a time, so memory stays flat for any count
+            for start in range(0, count, BATCH_SIZE):
+                ids = batch_uuids(min(BATCH_SIZE, count - start))
+                for i, note_id in enumerate(ids, start):
+                    file_time = start_time + i * hour
+                    yield insert_note(
+                        f"file_{i:04d}",
+                        "txt",
+                        f"Test file #{i}\n\nContent: {filler}",
+                        user_id,
+                        file_time,
+                        file_time,
+                        parent_id=main_folder_id,
+                        note_id=note_id,
+                    )[1]
+
+        # Maintaining the notes indexes and FTS/history triggers row by row
+        # is most of the insert cost, so rebuild them once afterwards
+        with suspended_indexes_and_triggers(conn, "notes"):
+            insert_note_rows(
+                conn,
+                gen_rows(),
+                on_batch=progress_reporter(count, "files"),
+            )
+
+        # notes_fts_insert did not fire, so index the new notes in one pass
+        conn.execute(
+            """
+            INSERT INTO notes_fts (id, title, abstract, content, user_id)
+            SELECT id, title, abstract, content, user_id FROM notes
+            """
         )
 
-        if (i + 1) % 20 == 0:
-            print(f"  Created {i + 1}/{count} files...")
+    if in_memory_build:
+        copy_to_disk(conn, db_file)
+        print(f"{GREEN}✓{RESET} In-memory database written to {db_path}")
+    conn.close()
 
     print(f"\n{BLUE}{'='*60}{RESET}")
     print(f"{GREEN}✓ Database with {count} files created successfully{RESET}")
     print(f"{BLUE}{'='*60}{RESET}\n")
 
-    print(f"Files are timestamped from {now - timedelta(hours=count)} to {now}")
+    print(f"Files are timestamped from {start_time} to {now}")
     print("Use this to test:")
     print("- Directory listing performance")
     print("- Timestamp ordering")
@@ -471,36 +684,48 @@ def show(db_path: str = typer.Argument(..., help="Path to SQLite database file")
     conn = sqlite3.connect(db_file)
     cursor = conn.cursor()
 
-    print(f"\n{BLUE}{'='*60}{RESET}")
-    print(f"Database: {db_path}")
-    print(f"{BLUE}{'='*60}{RESET}\n")
-
-    # Show folders
-    print(f"{BLUE}Folders:{RESET}")
-    cursor.execute(
-        "SELECT id, title, parent_id, created_at, updated_at FROM folders ORDER BY title"
-    )
-    for row in cursor.fetchall():
-        folder_id, title, parent_id, created_at, updated_at = row
-        parent_str = f" (parent: {parent_id[:8]}...)" if parent_id else ""
-        print(f"  {title}/{parent_str}")
-        print(f"    Created:  {created_at}")
-        print(f"    Modified: {updated_at}")
-
-    # Show notes
-    print(f"\n{BLUE}Notes:{RESET}")
-    cursor.execute(
-        "SELECT id, title, syntax, parent_id, created_at, updated_at FROM notes ORDER BY title"
-    )
-    for row in cursor.fetchall():
-        note_id, title, syntax, parent_id, created_at, updated_at = row
-        parent_str = f" (parent: {parent_id[:8]}...)" if parent_id else ""
-        print(f"  {title}.{syntax}{parent_str}")
-        print(f"    Created:  {created_at}")
-        print(f"    Modified: {updated_at}")
+    # Write each entry as one string through sys.stdout, which is already
+    # block-buffered when piped, instead of one print per line
+    out = sys.stdout
+    try:
+        out.write(f"\n{BLUE}{'='*60}{RESET}\nDatabase: {db_path}\n{BLUE}{'='*60}{RESET}\n\n")
+
+        # Show folders then notes from one query, streaming rows from the
+        # cursor and resolving parent IDs to titles in SQL
+        cursor.execute(
+            """
+            SELECT 'folder' AS kind, f.title AS title, NULL AS syntax, p.title,
+                   f.created_at, f.updated_at
+            FROM folders f LEFT JOIN folders p ON p.id = f.parent_id
+            UNION ALL
+            SELECT 'note', n.title, n.syntax, p.title,
+                   n.created_at, n.updated_at
+            FROM notes n LEFT JOIN folders p ON p.id = n.parent_id
+            ORDER BY kind, title
+            """
+        )
 
-    conn.close()
-    print(f"\n{BLUE}{'='*60}{RESET}\n")
+        out.write(f"{BLUE}Folders:{RESET}\n")
+        in_notes = False
+        for kind, title, syntax, parent_title, created_at, updated_at in cursor:
+            if kind == "note" and not in_notes:
+                out.write(f"\n{BLUE}Notes:{RESET}\n")
+                in_notes = True
+
+            name = f"{title}.{syntax}" if in_notes else f"{title}/"
+            parent_str = f" (parent: {parent_title}/)" if parent_title else ""
+            out.write(
+                f"  {name}{parent_str}\n"
+                f"    Created:  {created_at}\n"
+                f"    Modified: {updated_at}\n"
+            )
+
+        if not in_notes:
+            out.write(f"\n{BLUE}Notes:{RESET}\n")
+
+        out.write(f"\n{BLUE}{'='*60}{RESET}\n\n")
+    finally:
+        conn.close()
 
 
 if __name__ == "__main__":